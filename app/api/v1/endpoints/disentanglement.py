@@ -1,4 +1,5 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from typing import Optional, Literal
 import csv
 from datetime import datetime
@@ -17,10 +18,16 @@ async def import_chatroom_for_disentanglement(file_path: str):
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/chatroom/{room_id}", response_model=DisentanglementChatRoom)
-async def get_disentanglement_chatroom(room_id: str):
+@router.get("/chatroom/{room_id}")
+async def get_disentanglement_chatroom(room_id: str, request: Request):
     """Get a chat room with its disentanglement annotations"""
-    return await service.get_chatroom(room_id)
+    # The service holds already-validated data, so no response_model:
+    # serve cached bytes instead of re-validating and re-serializing
+    body = await service.get_chatroom_json(room_id)
+    etag = service.room_etag(room_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 @router.put("/chatroom/{room_id}/turns/{turn_id}/annotate")
 async def annotate_turn(
@@ -38,10 +45,24 @@ async def annotate_turn(
         annotation_notes=notes
     )
 
+@router.post("/chatroom/{room_id}/annotate_bulk")
+async def annotate_turns_bulk(room_id: str, annotations: list[dict]):
+    """Annotate a batch of turns in one request
+
+    Each entry: {turn_id, annotator_id, thread_id?, notes?}. Collapses N
+    round-trips and N room saves into one of each.
+    """
+    return await service.annotate_turns_bulk(room_id, annotations)
+
 @router.get("/chatroom/{room_id}/threads")
-async def get_thread_summary(room_id: str):
+async def get_thread_summary(room_id: str, request: Request, response: Response):
     """Get a summary of thread assignments in a chat room"""
-    return await service.get_thread_summary(room_id)
+    summary = await service.get_thread_summary(room_id)
+    etag = service.room_etag(room_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+    response.headers["ETag"] = etag
+    return summary
 
 @router.post("/chatroom/import/{format}")
 async def import_chatroom(
@@ -67,6 +88,15 @@ async def export_chatroom(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/chatroom/{room_id}/export/{format}/stream")
+async def stream_chatroom_export(
+    room_id: str,
+    format: Literal["csv", "json"] = "csv"
+):
+    """Stream chat room data as CSV or JSON without writing a file"""
+    chunks, media_type = await service.stream_chatroom(room_id, format)
+    return StreamingResponse(chunks, media_type=media_type)
+
 @router.get("/chatrooms")
 async def list_chatrooms():
     """Get a list of all available chat rooms"""
@@ -1,14 +1,22 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.api.v1.router import api_router
+from app.api.v1.endpoints.disentanglement import service as disentanglement_service
 
 app = FastAPI(
     title="Chat Disentanglement Annotation API",
     description="API for annotating chat message threads in the chat disentanglement task",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 app.include_router(api_router)
 
+@app.on_event("startup")
+async def load_annotation_data():
+    """Load persisted chat rooms before serving requests"""
+    await disentanglement_service.load_rooms()
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to the Annotation Tool API"} 
\ No newline at end of file
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
@@ -9,8 +10,19 @@ class ChatMessage(BaseModel):
     turn_text: str
     reply_to_turn: Optional[str] = None
 
-class DisentangledTurn(ChatMessage):
-    """Turn with disentanglement annotation data"""
+@dataclass(slots=True)
+class DisentangledTurn:
+    """Turn with disentanglement annotation data
+
+    A slotted dataclass rather than a Pydantic model: turns only exist
+    inside already-validated rooms, so per-instance __dict__ and
+    validator machinery would cost memory and time for nothing on rooms
+    with hundreds of thousands of turns.
+    """
+    user_id: str
+    turn_id: str
+    turn_text: str
+    reply_to_turn: Optional[str] = None
     thread_id: Optional[str] = None
     annotator_id: Optional[str] = None  # Who performed the disentanglement
     annotation_timestamp: Optional[datetime] = None
@@ -1,94 +1,402 @@
+import asyncio
+import io
 import json
 import os
 import csv
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict
 from pathlib import Path
 from fastapi import HTTPException
 from datetime import datetime
 from typing import Optional, Literal
 
+import ijson
+import orjson
+from pydantic import TypeAdapter
+
 from app.models.disentanglement import DisentangledTurn, DisentanglementChatRoom
 
+# Shared adapter: goes straight between model and JSON bytes in
+# pydantic-core, with no Python dict intermediate
+_ROOM_ADAPTER = TypeAdapter(DisentanglementChatRoom)
+
+FLUSH_DELAY_SECONDS = 0.5
+
+# Thread-column values that mean "not annotated"
+_SENTINELS = frozenset({'', 'none', 'null'})
+
+# Accepted names for the thread column in imported CSVs
+_THREAD_VARIANTS = ('thread_id', 'thread', 'thread_num', 'thread_number')
+
+# JSON imports above this size are streamed with ijson instead of being
+# parsed in one orjson call, keeping memory flat in the turn count
+_STREAM_THRESHOLD_BYTES = 8 * 1024 * 1024
+
+# How many room files may be read from disk at once during startup
+_LOAD_CONCURRENCY = 32
+
+# How many fully-materialized rooms to keep in memory; least recently
+# used rooms beyond this are flushed and dropped
+MAX_CACHED_ROOMS = 16
+
+# Column order for CSV exports
+_EXPORT_FIELDS = (
+    'user_id', 'turn_id', 'turn_text', 'reply_to_turn',
+    'thread_id', 'annotator_id', 'annotation_timestamp', 'annotation_notes'
+)
+
 class DisentanglementService:
     def __init__(self):
         # Create data directory if it doesn't exist
         self.data_dir = Path("data/chatrooms")
         self.data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing rooms from disk
-        self.disentanglement_rooms: dict[str, DisentanglementChatRoom] = self._load_rooms()
-
-    def _load_rooms(self) -> dict[str, DisentanglementChatRoom]:
-        """Load all chat rooms from disk"""
-        rooms = {}
-        for file in self.data_dir.glob("*.json"):
-            with open(file, 'r') as f:
-                data = json.load(f)
-                room = DisentanglementChatRoom.parse_obj(data)
-                rooms[room.room_id] = room
-        return rooms
+
+        # Per-room O(1) lookups: turn_id -> turn and thread_id -> [turn_id]
+        self._turn_index: dict[str, dict[str, DisentangledTurn]] = {}
+        self._thread_index: dict[str, dict[str, list[str]]] = {}
+
+        # Memoized get_thread_summary responses, dropped on any mutation
+        self._thread_summary_cache: dict[str, dict] = {}
+
+        # Per-room listing stats, maintained incrementally so
+        # list_chatrooms never walks turns
+        self._room_stats: dict[str, dict] = {}
+
+        # Monotonic per-room version, bumped on every mutation; backs the
+        # ETag handling in the read endpoints
+        self._room_version: dict[str, int] = {}
+
+        # Serialized room bytes served by the room GET, dropped on mutation
+        self._room_json_cache: dict[str, bytes] = {}
+
+        # room_id -> file path for every room on disk; built by
+        # load_rooms() from the startup event
+        self._room_paths: dict[str, Path] = {}
+
+        # LRU cache of materialized rooms; most requests touch one room,
+        # so everything else stays on disk
+        self._rooms: OrderedDict[str, DisentanglementChatRoom] = OrderedDict()
+
+        # Serializes bulk annotation batches per room
+        self._room_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Rooms with in-memory annotations not yet flushed to disk
+        self._dirty: set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+        # Append-only journal of annotations, replayed after load_rooms
+        # so a crash between flushes doesn't lose work
+        self._journal_path = self.data_dir / "annotations.ndjson"
+        self._journal_fd = os.open(
+            self._journal_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644
+        )
+
+    @staticmethod
+    def _build_turn(row: dict) -> DisentangledTurn:
+        """Construct a turn from trusted on-disk data, skipping validation"""
+        ts = row.get('annotation_timestamp')
+        if isinstance(ts, str):
+            row['annotation_timestamp'] = datetime.fromisoformat(ts)
+        return DisentangledTurn(**row)
+
+    def _import_json_turn(self, turn_data: dict, file_path: str) -> DisentangledTurn:
+        """Build one imported turn, marking pre-annotated turns as such"""
+        turn = self._build_turn(turn_data)
+        # Set annotation metadata if thread_id exists
+        if turn.thread_id:
+            turn.annotator_id = turn.annotator_id or 'imported'
+            turn.annotation_timestamp = turn.annotation_timestamp or datetime.now()
+            turn.annotation_notes = turn.annotation_notes or f"Imported from {file_path}"
+        return turn
+
+    @staticmethod
+    def _load_one(path: Path) -> DisentanglementChatRoom:
+        """Read and validate one room file (blocking, run in a thread)
+
+        One pass from bytes to model in pydantic-core.
+        """
+        return _ROOM_ADAPTER.validate_json(path.read_bytes())
+
+    @staticmethod
+    def _scan_stats(path: Path) -> dict:
+        """Compute listing stats for a room file without keeping the room
+
+        A plain orjson parse is enough here; the room is materialized and
+        validated only when something actually reads it.
+        """
+        data = orjson.loads(path.read_bytes())
+        threads = set()
+        annotated = 0
+        for turn in data['turns']:
+            thread = turn.get('thread_id')
+            if thread is not None:
+                threads.add(thread)
+                annotated += 1
+        return {
+            "room_id": data['room_id'],
+            "turn_count": len(data['turns']),
+            "annotated_turns": annotated,
+            "thread_count": len(threads)
+        }
+
+    async def load_rooms(self):
+        """Index the rooms on disk and warm the listing stats
+
+        Called once from the app startup event. Rooms themselves load
+        lazily on first access; here we only record their paths and scan
+        stats concurrently in a bounded thread pool, so startup cost and
+        resident memory stay small no matter how many rooms exist.
+        """
+        # Dispatch in inode order to minimize seeks on spinning disks
+        paths = sorted(self.data_dir.glob("*.json"), key=lambda p: p.stat().st_ino)
+        self._room_paths = {path.stem: path for path in paths}
+        semaphore = asyncio.Semaphore(_LOAD_CONCURRENCY)
+
+        async def scan(path: Path) -> dict:
+            async with semaphore:
+                return await asyncio.to_thread(self._scan_stats, path)
+
+        for stats in await asyncio.gather(*(scan(path) for path in paths)):
+            self._room_stats[stats["room_id"]] = stats
+
+        await self._replay_journal()
+
+    async def _get_room(self, room_id: str) -> DisentanglementChatRoom:
+        """Return a room, materializing it from disk on first access"""
+        room = self._rooms.get(room_id)
+        if room is not None:
+            self._rooms.move_to_end(room_id)
+            return room
+
+        path = self._room_paths.get(room_id)
+        if path is None:
+            raise HTTPException(status_code=404, detail="Chat room not found")
+
+        room = await asyncio.to_thread(self._load_one, path)
+        self._rooms[room_id] = room
+        self._index_room(room)
+        self._evict_lru()
+        return room
+
+    def _evict_lru(self):
+        """Drop least recently used rooms beyond the cache limit"""
+        while len(self._rooms) > MAX_CACHED_ROOMS:
+            room_id, room = next(iter(self._rooms.items()))
+            if room_id in self._dirty:
+                # Never lose unflushed annotations to an eviction
+                self._save_room(room)
+                self._dirty.discard(room_id)
+            del self._rooms[room_id]
+            self._turn_index.pop(room_id, None)
+            self._thread_index.pop(room_id, None)
+            self._thread_summary_cache.pop(room_id, None)
+            self._room_json_cache.pop(room_id, None)
+
+    def _index_room(self, room: DisentanglementChatRoom):
+        """(Re)build the turn/thread lookup indexes and stats for a room"""
+        threads: dict[str, list[str]] = {}
+        annotated = 0
+        # Duplicate id strings are collapsed to one shared object per
+        # room: a 100k-turn room has a handful of distinct users/threads
+        # but was holding a separate str for each turn
+        users: dict[str, str] = {}
+        thread_names: dict[str, str] = {}
+        for turn in room.turns:
+            turn.user_id = users.setdefault(turn.user_id, turn.user_id)
+            if turn.thread_id is not None:
+                turn.thread_id = thread_names.setdefault(turn.thread_id, turn.thread_id)
+                threads.setdefault(turn.thread_id, []).append(turn.turn_id)
+                annotated += 1
+        self._turn_index[room.room_id] = {turn.turn_id: turn for turn in room.turns}
+        self._thread_index[room.room_id] = threads
+        self._room_stats[room.room_id] = {
+            "room_id": room.room_id,
+            "turn_count": len(room.turns),
+            "annotated_turns": annotated,
+            "thread_count": len(threads)
+        }
+        self._room_version[room.room_id] = self._room_version.get(room.room_id, 0) + 1
+        self._room_json_cache.pop(room.room_id, None)
+
+    def room_etag(self, room_id: str) -> str:
+        """Weak ETag for the current in-memory state of a room"""
+        return f'W/"{self._room_version.get(room_id, 0)}"'
+
+    def _move_turn_thread(self, room_id: str, turn: DisentangledTurn, thread_id: Optional[str]):
+        """Assign a turn to a thread, keeping the thread index in sync"""
+        threads = self._thread_index[room_id]
+        if turn.thread_id and turn.thread_id in threads:
+            members = threads[turn.thread_id]
+            if turn.turn_id in members:
+                members.remove(turn.turn_id)
+            if not members:
+                del threads[turn.thread_id]
+        if thread_id:
+            threads.setdefault(thread_id, []).append(turn.turn_id)
+        turn.thread_id = thread_id
 
     def _save_room(self, room: DisentanglementChatRoom):
-        """Save a chat room to disk"""
+        """Save a chat room to disk atomically
+
+        Write to a temp file, fsync, then rename over the real file so a
+        crash mid-save can never leave a half-written room behind.
+        """
         file_path = self.data_dir / f"{room.room_id}.json"
-        with open(file_path, 'w') as f:
-            json.dump(room.dict(), f, default=str)
+        tmp_path = f"{file_path}.tmp"
+        data = _ROOM_ADAPTER.dump_json(room)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+
+    async def _replay_journal(self):
+        """Re-apply journaled annotations that never made it into a full save"""
+        if not self._journal_path.exists():
+            return
+        touched = set()
+        for line in self._journal_path.read_bytes().splitlines():
+            if line:
+                entry = orjson.loads(line)
+                if entry['room_id'] not in self._room_paths:
+                    continue
+                await self._get_room(entry['room_id'])
+                turn = self._turn_index[entry['room_id']].get(entry['turn_id'])
+                if turn is None:
+                    continue
+                self._move_turn_thread(entry['room_id'], turn, entry['thread_id'])
+                turn.annotator_id = entry['annotator_id']
+                turn.annotation_timestamp = datetime.fromisoformat(
+                    entry['annotation_timestamp']
+                )
+                turn.annotation_notes = entry.get('annotation_notes')
+                # Dirty so an LRU eviction mid-replay flushes the room
+                self._dirty.add(entry['room_id'])
+                touched.add(entry['room_id'])
+        for room_id in touched:
+            room = self._rooms.get(room_id)
+            if room is None:
+                # Already flushed during eviction
+                continue
+            # Replay bypassed the incremental bookkeeping, so rebuild
+            self._index_room(room)
+            self._save_room(room)
+            self._dirty.discard(room_id)
+        self._journal_path.write_bytes(b"")
+
+    def _journal_annotation(self, room_id: str, turn: DisentangledTurn):
+        """Append one annotation to the journal in a single write syscall"""
+        entry = {
+            "room_id": room_id,
+            "turn_id": turn.turn_id,
+            "thread_id": turn.thread_id,
+            "annotator_id": turn.annotator_id,
+            "annotation_timestamp": turn.annotation_timestamp,
+            "annotation_notes": turn.annotation_notes
+        }
+        os.write(self._journal_fd, orjson.dumps(entry) + b"\n")
+
+    def _mark_dirty(self, room_id: str):
+        """Queue a room for the next debounced disk flush"""
+        self._dirty.add(room_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """Wait briefly so a burst of annotations becomes one save per room"""
+        await asyncio.sleep(FLUSH_DELAY_SECONDS)
+        async with self._flush_lock:
+            # Saves run in a thread, so re-check for rooms dirtied while a
+            # save was in flight before truncating the journal
+            while self._dirty:
+                dirty, self._dirty = self._dirty, set()
+                for room_id in dirty:
+                    room = self._rooms.get(room_id)
+                    if room is not None:
+                        await asyncio.to_thread(self._save_room, room)
+            # Everything journaled so far is now in the room files
+            os.ftruncate(self._journal_fd, 0)
+
+    def _import_csv_sync(self, file_path: str) -> list[DisentangledTurn]:
+        """Parse a CSV chat export into turns (blocking, run in a thread)"""
+        turns = []
+        with open(file_path, 'r', buffering=1 << 20, newline='') as file:
+            reader = csv.reader(file)
+            headers = next(reader)
+
+            # Resolve column positions once so the row loop does pure
+            # list indexing instead of per-row dict allocation
+            user_idx = headers.index('user_id')
+            turn_idx = headers.index('turn_id')
+            text_idx = headers.index('turn_text')
+            reply_idx = headers.index('reply_to_turn') if 'reply_to_turn' in headers else -1
+
+            # Look for thread column with various possible names
+            thread_idx = next(
+                (headers.index(v) for v in _THREAD_VARIANTS if v in headers), -1
+            )
+
+            import_timestamp = datetime.now()
+            import_note = f"Imported from {file_path}"
+            for row in reader:
+                # Extract existing thread_id if available
+                existing_thread = None
+                if thread_idx != -1:
+                    raw_thread = row[thread_idx].strip()
+                    if raw_thread.lower() not in _SENTINELS:
+                        existing_thread = raw_thread
+
+                turn = DisentangledTurn(
+                    user_id=row[user_idx],
+                    turn_id=row[turn_idx],
+                    turn_text=row[text_idx],
+                    reply_to_turn=(row[reply_idx] or None) if reply_idx != -1 else None,
+                    thread_id=existing_thread,
+                    # If there's a thread_id, we can assume it was previously annotated
+                    annotator_id='imported' if existing_thread else None,
+                    annotation_timestamp=import_timestamp if existing_thread else None,
+                    annotation_notes=import_note if existing_thread else None
+                )
+                turns.append(turn)
+        return turns
+
+    def _import_json_sync(self, file_path: str) -> list[DisentangledTurn]:
+        """Parse a JSON chat export into turns (blocking, run in a thread)"""
+        turns = []
+        if os.path.getsize(file_path) > _STREAM_THRESHOLD_BYTES:
+            # Stream turn-by-turn so memory stays flat on huge rooms
+            with open(file_path, 'rb') as file:
+                for turn_data in ijson.items(file, 'turns.item'):
+                    turns.append(self._import_json_turn(turn_data, file_path))
+        else:
+            # Small files: one orjson parse beats streaming overhead
+            data = orjson.loads(Path(file_path).read_bytes())
+            for turn_data in data['turns']:
+                turns.append(self._import_json_turn(turn_data, file_path))
+        return turns
 
     async def import_chatroom(self, file_path: str, format: Literal["csv", "json"] = "csv"):
         """Import chat data from CSV or JSON, preserving existing thread annotations"""
-        turns = []
-        
+        # Parsing is blocking file I/O; run it off the event loop so other
+        # requests stay responsive during a large import
         if format == "csv":
-            with open(file_path, 'r') as file:
-                reader = csv.DictReader(file)
-                headers = reader.fieldnames
-                
-                # Look for thread column with various possible names
-                thread_column = None
-                thread_column_variants = ['thread_id', 'thread', 'thread_num', 'thread_number']
-                for variant in thread_column_variants:
-                    if variant in headers:
-                        thread_column = variant
-                        break
-                
-                for row in reader:
-                    # Extract existing thread_id if available
-                    existing_thread = None
-                    if thread_column and row.get(thread_column):
-                        existing_thread = str(row[thread_column]).strip()
-                        # Handle empty strings or "None" values
-                        if existing_thread.lower() in ('', 'none', 'null'):
-                            existing_thread = None
-                    
-                    turn = DisentangledTurn(
-                        user_id=row['user_id'],
-                        turn_id=row['turn_id'],
-                        turn_text=row['turn_text'],
-                        reply_to_turn=row.get('reply_to_turn'),
-                        thread_id=existing_thread,
-                        # If there's a thread_id, we can assume it was previously annotated
-                        annotator_id='imported' if existing_thread else None,
-                        annotation_timestamp=datetime.now() if existing_thread else None,
-                        annotation_notes=f"Imported from {file_path}" if existing_thread else None
-                    )
-                    turns.append(turn)
-        else:  # json
-            with open(file_path, 'r') as file:
-                data = json.load(file)
-                for turn_data in data['turns']:
-                    # For JSON, we can directly use the thread_id if it exists
-                    turn = DisentangledTurn.parse_obj(turn_data)
-                    # Set annotation metadata if thread_id exists
-                    if turn.thread_id:
-                        turn.annotator_id = turn.annotator_id or 'imported'
-                        turn.annotation_timestamp = turn.annotation_timestamp or datetime.now()
-                        turn.annotation_notes = turn.annotation_notes or f"Imported from {file_path}"
-                    turns.append(turn)
+            turns = await asyncio.to_thread(self._import_csv_sync, file_path)
+        else:
+            turns = await asyncio.to_thread(self._import_json_sync, file_path)
 
         room_id = Path(file_path).stem
         chat_room = DisentanglementChatRoom(room_id=room_id, turns=turns)
-        self.disentanglement_rooms[room_id] = chat_room
-        self._save_room(chat_room)
-        
+        self._rooms[room_id] = chat_room
+        self._rooms.move_to_end(room_id)
+        self._room_paths[room_id] = self.data_dir / f"{room_id}.json"
+        self._index_room(chat_room)
+        self._thread_summary_cache.pop(room_id, None)
+        await asyncio.to_thread(self._save_room, chat_room)
+        self._evict_lru()
+
         return {
             "message": f"Successfully imported chat room {room_id}",
             "total_turns": len(turns),
@@ -102,34 +410,76 @@ class DisentanglementService:
         output_path: Optional[str] = None
     ) -> str:
         """Export chat room data to CSV or JSON"""
-        if room_id not in self.disentanglement_rooms:
-            raise HTTPException(status_code=404, detail="Chat room not found")
+        chat_room = await self._get_room(room_id)
 
-        chat_room = self.disentanglement_rooms[room_id]
-        
         if output_path is None:
             output_path = self.data_dir / f"export_{room_id}.{format}"
-        
+
+        # The actual file write is blocking; keep it off the event loop
         if format == "csv":
-            with open(output_path, 'w', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=[
-                    'user_id', 'turn_id', 'turn_text', 'reply_to_turn',
-                    'thread_id', 'annotator_id', 
-                    'annotation_timestamp', 'annotation_notes'
-                ])
-                writer.writeheader()
-                for turn in chat_room.turns:
-                    writer.writerow(turn.dict())
-        else:  # json
-            with open(output_path, 'w') as file:
-                json.dump(chat_room.dict(), file, default=str, indent=2)
+            await asyncio.to_thread(self._export_csv_sync, chat_room, output_path)
+        else:
+            await asyncio.to_thread(self._export_json_sync, chat_room, output_path)
 
         return str(output_path)
 
+    @staticmethod
+    def _export_csv_sync(chat_room: DisentanglementChatRoom, output_path):
+        """Write a room to CSV (blocking, run in a thread)"""
+        with open(output_path, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=list(_EXPORT_FIELDS))
+            writer.writeheader()
+            for turn in chat_room.turns:
+                writer.writerow(asdict(turn))
+
+    @staticmethod
+    def _export_json_sync(chat_room: DisentanglementChatRoom, output_path):
+        """Write a room to JSON (blocking, run in a thread)"""
+        with open(output_path, 'w') as file:
+            json.dump(chat_room.model_dump(mode="json"), file, indent=2)
+
+    async def stream_chatroom(self, room_id: str, format: Literal["csv", "json"] = "csv"):
+        """Return (chunk generator, media type) for a streamed export"""
+        chat_room = await self._get_room(room_id)
+        if format == "csv":
+            return self._iter_csv(chat_room), "text/csv"
+        return self._iter_json(chat_room), "application/json"
+
+    @staticmethod
+    def _iter_csv(chat_room: DisentanglementChatRoom, chunk_rows: int = 500):
+        """Yield CSV chunks; csv.writer into a reused buffer keeps quoting
+        correct without DictWriter's per-row dict allocation"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(_EXPORT_FIELDS)
+        for i, turn in enumerate(chat_room.turns, 1):
+            writer.writerow([getattr(turn, field) for field in _EXPORT_FIELDS])
+            if i % chunk_rows == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    @staticmethod
+    def _iter_json(chat_room: DisentanglementChatRoom):
+        """Yield JSON fragments, one orjson-encoded turn at a time"""
+        yield b'{"room_id":' + orjson.dumps(chat_room.room_id) + b',"turns":['
+        separator = b''
+        for turn in chat_room.turns:
+            yield separator + orjson.dumps(turn)
+            separator = b','
+        yield b']}'
+
     async def get_chatroom(self, room_id: str):
-        if room_id not in self.disentanglement_rooms:
-            raise HTTPException(status_code=404, detail="Chat room not found")
-        return self.disentanglement_rooms[room_id]
+        return await self._get_room(room_id)
+
+    async def get_chatroom_json(self, room_id: str) -> bytes:
+        """Serialized room bytes, cached until the room mutates"""
+        cached = self._room_json_cache.get(room_id)
+        if cached is None:
+            cached = _ROOM_ADAPTER.dump_json(await self._get_room(room_id))
+            self._room_json_cache[room_id] = cached
+        return cached
 
     async def annotate_turn(
         self,
@@ -140,62 +490,132 @@ class DisentanglementService:
         annotation_notes: Optional[str] = None
     ):
         """Annotate a turn with thread information"""
-        if room_id not in self.disentanglement_rooms:
-            raise HTTPException(status_code=404, detail="Chat room not found")
-        
-        chat_room = self.disentanglement_rooms[room_id]
-        for turn in chat_room.turns:
-            if turn.turn_id == turn_id:
-                turn.thread_id = thread_id
-                turn.annotator_id = annotator_id
-                turn.annotation_timestamp = datetime.now()
-                turn.annotation_notes = annotation_notes
-                # Save changes to disk
-                self._save_room(chat_room)
-                return {
-                    "message": f"Turn {turn_id} annotated",
-                    "annotation_timestamp": turn.annotation_timestamp
-                }
-        
-        raise HTTPException(status_code=404, detail="Turn not found")
-    
-    async def get_thread_summary(self, room_id: str):
-        if room_id not in self.disentanglement_rooms:
-            raise HTTPException(status_code=404, detail="Chat room not found")
-        
-        chat_room = self.disentanglement_rooms[room_id]
-        threads = {}
-        for turn in chat_room.turns:
-            if turn.thread_id:
-                if turn.thread_id not in threads:
-                    threads[turn.thread_id] = []
-                threads[turn.thread_id].append(turn.turn_id)
-        
+        await self._get_room(room_id)
+
+        turn = self._turn_index[room_id].get(turn_id)
+        if turn is None:
+            raise HTTPException(status_code=404, detail="Turn not found")
+
+        self._apply_annotation(
+            room_id, turn, annotator_id, thread_id, annotation_notes, datetime.now()
+        )
+        self._invalidate_room_caches(room_id)
+        # Journal immediately for crash safety, defer the full-room
+        # rewrite to the debounced flush
+        self._journal_annotation(room_id, turn)
+        self._mark_dirty(room_id)
         return {
-            "room_id": room_id,
-            "thread_count": len(threads),
-            "threads": threads
+            "message": f"Turn {turn_id} annotated",
+            "annotation_timestamp": turn.annotation_timestamp
+        }
+
+    def _apply_annotation(
+        self,
+        room_id: str,
+        turn: DisentangledTurn,
+        annotator_id: str,
+        thread_id: Optional[str],
+        annotation_notes: Optional[str],
+        timestamp: datetime
+    ):
+        """Mutate one turn, keeping the indexes and listing stats current"""
+        previous_thread = turn.thread_id
+        self._move_turn_thread(room_id, turn, thread_id)
+
+        stats = self._room_stats[room_id]
+        if previous_thread is None and thread_id is not None:
+            stats["annotated_turns"] += 1
+        elif previous_thread is not None and thread_id is None:
+            stats["annotated_turns"] -= 1
+        stats["thread_count"] = len(self._thread_index[room_id])
+
+        turn.annotator_id = annotator_id
+        turn.annotation_timestamp = timestamp
+        turn.annotation_notes = annotation_notes
+
+    def _invalidate_room_caches(self, room_id: str):
+        """Drop derived state after a mutation and bump the room version"""
+        self._thread_summary_cache.pop(room_id, None)
+        self._room_json_cache.pop(room_id, None)
+        self._room_version[room_id] += 1
+
+    async def annotate_turns_bulk(self, room_id: str, annotations: list[dict]):
+        """Annotate a batch of turns with one journal write and one flush
+
+        Each entry carries turn_id, annotator_id and optional
+        thread_id/notes, mirroring the single-turn endpoint. The whole
+        batch shares a timestamp, the journal lines go out in a single
+        write syscall, and the room is saved once by the debounced flush.
+        """
+        await self._get_room(room_id)
+        async with self._room_locks[room_id]:
+            turn_index = self._turn_index[room_id]
+            timestamp = datetime.now()
+            lines = []
+            skipped = []
+            for item in annotations:
+                turn = turn_index.get(item.get("turn_id"))
+                if turn is None:
+                    skipped.append(item.get("turn_id"))
+                    continue
+                self._apply_annotation(
+                    room_id, turn,
+                    item.get("annotator_id"),
+                    item.get("thread_id"),
+                    item.get("notes"),
+                    timestamp
+                )
+                lines.append(orjson.dumps({
+                    "room_id": room_id,
+                    "turn_id": turn.turn_id,
+                    "thread_id": turn.thread_id,
+                    "annotator_id": turn.annotator_id,
+                    "annotation_timestamp": turn.annotation_timestamp,
+                    "annotation_notes": turn.annotation_notes
+                }))
+            if lines:
+                os.write(self._journal_fd, b"\n".join(lines) + b"\n")
+                self._invalidate_room_caches(room_id)
+                self._mark_dirty(room_id)
+        return {
+            "message": f"Annotated {len(lines)} turns in chat room {room_id}",
+            "updated": len(lines),
+            "skipped_turns": skipped,
+            "annotation_timestamp": timestamp
         }
+    
+    async def get_thread_summary(self, room_id: str):
+        summary = self._thread_summary_cache.get(room_id)
+        if summary is None:
+            await self._get_room(room_id)
+            threads = self._thread_index[room_id]
+            summary = {
+                "room_id": room_id,
+                "thread_count": len(threads),
+                "threads": threads
+            }
+            self._thread_summary_cache[room_id] = summary
+        return summary
 
     async def list_chatrooms(self):
         """Get a list of all available chat rooms with basic metadata"""
-        rooms_summary = []
-        for room_id, room in self.disentanglement_rooms.items():
-            rooms_summary.append({
-                "room_id": room_id,
-                "turn_count": len(room.turns),
-                "annotated_turns": sum(1 for turn in room.turns if turn.thread_id is not None),
-                "thread_count": len(set(turn.thread_id for turn in room.turns if turn.thread_id is not None))
-            })
-        return rooms_summary
+        return list(self._room_stats.values())
 
     async def delete_chatroom(self, room_id: str):
         """Delete a chat room and its data"""
-        if room_id not in self.disentanglement_rooms:
+        if room_id not in self._room_paths:
             raise HTTPException(status_code=404, detail="Chat room not found")
-        
+
         # Remove from memory
-        del self.disentanglement_rooms[room_id]
+        del self._room_paths[room_id]
+        self._rooms.pop(room_id, None)
+        self._turn_index.pop(room_id, None)
+        self._thread_index.pop(room_id, None)
+        self._thread_summary_cache.pop(room_id, None)
+        self._room_stats.pop(room_id, None)
+        self._room_version.pop(room_id, None)
+        self._room_json_cache.pop(room_id, None)
+        self._dirty.discard(room_id)
         
         # Remove from disk
         file_path = self.data_dir / f"{room_id}.json"